@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import fnmatch
+import functools
 import re
 from dataclasses import dataclass, field
 from typing import Iterable, Literal
@@ -10,14 +11,46 @@ import mobase
 from .utils import is_directory
 
 
+@functools.lru_cache(maxsize=None)
+def _translate(glob: str) -> str:
+    """Cached `fnmatch.translate`, the checkers are recreated with the same globs."""
+    return fnmatch.translate(glob)
+
+
+def _is_literal(glob: str) -> bool:
+    """Check if the glob pattern has no wildcards / special characters."""
+    return not any(c in glob for c in "*?[")
+
+
 class OptionalRegexPattern:
     _pattern: re.Pattern[str] | None
+    """Regex of the globs containing wildcards."""
+
+    _pattern_indices: list[int]
+    """Index of the `_pattern` globs in the original glob list."""
+
+    _literals: dict[str, int]
+    """Casefolded literal (wildcard free) globs with their index in the glob list.
+    Matched by dict lookup instead of regex."""
 
     def __init__(self, globs: Iterable[str] | None) -> None:
+        self._pattern_indices = []
+        self._literals = {}
         if globs is None:
             self._pattern = None
         else:
-            self._pattern = OptionalRegexPattern.regex_from_glob_list(globs)
+            wildcard_globs: list[str] = []
+            for index, glob in enumerate(globs):
+                if _is_literal(glob):
+                    self._literals.setdefault(glob.casefold(), index)
+                else:
+                    wildcard_globs.append(glob)
+                    self._pattern_indices.append(index)
+            self._pattern = (
+                OptionalRegexPattern.regex_from_glob_list(wildcard_globs)
+                if wildcard_globs
+                else None
+            )
 
     @staticmethod
     def regex_from_glob_list(glob_list: Iterable[str]) -> re.Pattern[str]:
@@ -27,15 +60,28 @@ class OptionalRegexPattern:
         Every pattern has a capturing group, so that `match.lastindex - 1` will
         give the `glob_list` index.
         """
-        return re.compile(
-            "|".join(f"({fnmatch.translate(f)})" for f in glob_list), re.I
-        )
+        return re.compile("|".join(f"({_translate(f)})" for f in glob_list), re.I)
 
     def match(self, value: str) -> bool:
+        if value.casefold() in self._literals:
+            return True
         if self._pattern is None:
             return False
         return bool(self._pattern.match(value))
 
+    def match_index(self, value: str) -> int | None:
+        """
+        Returns the index of the first glob matching the given value, or None if no
+        glob matches.
+        """
+        index = self._literals.get(value.casefold())
+        if self._pattern is not None and (match := self._pattern.match(value)):
+            assert match.lastindex is not None
+            pattern_index = self._pattern_indices[match.lastindex - 1]
+            if index is None or pattern_index < index:
+                index = pattern_index
+        return index
+
 
 class RegexPatterns:
     """
@@ -47,19 +93,17 @@ class RegexPatterns:
         self.delete = OptionalRegexPattern(globs.delete)
         self.valid = OptionalRegexPattern(globs.valid)
 
-        self.move = {
-            key: re.compile(fnmatch.translate(key), re.I) for key in globs.move
-        }
+        self._move_keys = list(globs.move)
+        self._move = OptionalRegexPattern(self._move_keys or None)
 
     def move_match(self, value: str) -> str | None:
         """
         Retrieve the first move patterns that matches the given value, or None if no
         move matches.
         """
-        for key, pattern in self.move.items():
-            if pattern.match(value):
-                return key
-        return None
+        # All move patterns are matched at once, see `OptionalRegexPattern.match_index`.
+        index = self._move.match_index(value)
+        return None if index is None else self._move_keys[index]
 
 
 def _merge_list(l1: list[str] | None, l2: list[str] | None) -> list[str] | None:
@@ -8,7 +8,7 @@ from typing import Any, Callable, Self, Sequence
 
 import mobase
 from PyQt6.QtCore import QDateTime, QLocale, Qt
-from PyQt6.QtGui import QImage, QPixmap
+from PyQt6.QtGui import QImage, QPixmap, QPixmapCache
 from PyQt6.QtWidgets import QFormLayout, QLabel, QSizePolicy, QVBoxLayout, QWidget
 
 
@@ -97,6 +97,8 @@ class BasicGameSaveGameInfoWidget(mobase.ISaveGameInfoWidget):
         form_layout.setVerticalSpacing(2)
         layout.addWidget(self._metadata_widget)
         self._metadata_widget.hide()  # Backwards compatibility (no metadata)
+        # Form rows are kept and reused for the next save.
+        self._metadata_rows: list[tuple[QLabel, QLabel]] = []
 
         # Preview (pixmap)
         self._label = QLabel()
@@ -113,10 +115,6 @@ class BasicGameSaveGameInfoWidget(mobase.ISaveGameInfoWidget):
         # Clear previous
         self.hide()
         self._label.clear()
-        while self._metadata_layout.count():
-            layoutItem = self._metadata_layout.takeAt(0)
-            if layoutItem is not None and (w := layoutItem.widget()):
-                w.deleteLater()
 
         # Retrieve the pixmap and metadata:
         preview = self._get_preview(save_path)
@@ -127,20 +125,17 @@ class BasicGameSaveGameInfoWidget(mobase.ISaveGameInfoWidget):
             if isinstance(preview, str):
                 preview = Path(preview)
             if isinstance(preview, Path):
-                if preview.exists():
-                    pixmap = QPixmap(str(preview))
-                else:
-                    print(
-                        f"Failed to retrieve the preview, file not found: {preview}",
-                        file=sys.stderr,
-                    )
-            elif isinstance(preview, QImage):
-                pixmap = QPixmap.fromImage(preview)
+                # Already scaled
+                pixmap = self._load_scaled_preview(preview)
             else:
-                pixmap = preview
+                if isinstance(preview, QImage):
+                    pixmap = QPixmap.fromImage(preview)
+                else:
+                    pixmap = preview
+                if not pixmap.isNull():
+                    pixmap = pixmap.scaledToWidth(self._max_width)
         if pixmap and not pixmap.isNull():
-            # Scale the pixmap and show it:
-            pixmap = pixmap.scaledToWidth(self._max_width)
+            # Show the scaled pixmap:
             self._label.setPixmap(pixmap)
             self._label.show()
         else:
@@ -150,10 +145,8 @@ class BasicGameSaveGameInfoWidget(mobase.ISaveGameInfoWidget):
         # Add metadata, file date by default.
         metadata = self._get_metadata(save_path, save)
         if metadata:
-            for key, value in metadata.items():
-                self._metadata_layout.addRow(*self._new_form_row(key, str(value)))
+            self._set_metadata(metadata)
             self._metadata_widget.show()
-            self._metadata_widget.setLayout(self._metadata_layout)
             self._metadata_widget.adjustSize()
         else:
             self._metadata_widget.hide()
@@ -162,6 +155,47 @@ class BasicGameSaveGameInfoWidget(mobase.ISaveGameInfoWidget):
             self.adjustSize()
             self.show()
 
+    def _load_scaled_preview(self, preview: Path) -> QPixmap | None:
+        """Load the preview file, scaled to the maximum width.
+
+        The scaled pixmap is kept in the `QPixmapCache`, by file path, modification
+        time and width.
+        """
+        try:
+            mtime = preview.stat().st_mtime_ns
+        except OSError:
+            print(
+                f"Failed to retrieve the preview, file not found: {preview}",
+                file=sys.stderr,
+            )
+            return None
+        key = f"basic_games_preview:{preview}:{mtime}:{self._max_width}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None or pixmap.isNull():
+            pixmap = QPixmap(str(preview))
+            if not pixmap.isNull():
+                pixmap = pixmap.scaledToWidth(self._max_width)
+                QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    def _set_metadata(self, metadata: Mapping[str, Any]):
+        """Fill the metadata form, reusing the rows of the previous save and
+        hiding the surplus ones.
+        """
+        rows = self._metadata_rows
+        for i, (key, value) in enumerate(metadata.items()):
+            if i < len(rows):
+                qLabel, qField = rows[i]
+                qLabel.setText(key)
+                qField.setText(str(value))
+                self._metadata_layout.setRowVisible(i, True)
+            else:
+                row = self._new_form_row(key, str(value))
+                self._metadata_layout.addRow(*row)
+                rows.append(row)
+        for i in range(len(metadata), len(rows)):
+            self._metadata_layout.setRowVisible(i, False)
+
     def _new_form_row(self, label: str = "", field: str = ""):
         qLabel = QLabel(text=label)
         qLabel.setAlignment(Qt.AlignmentFlag.AlignTop)
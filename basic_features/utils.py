@@ -1,7 +1,38 @@
-from typing import TypeGuard
+import os
+from typing import Iterator, TypeGuard
 
 import mobase
 
 
 def is_directory(entry: mobase.FileTreeEntry) -> TypeGuard[mobase.IFileTree]:
     return entry.isDir()
+
+
+def scan_files_with_suffix(
+    root: str, suffix: str, first_per_folder: bool = False
+) -> Iterator[str]:
+    """Yields the paths of all files in `root` (recursive) ending with `suffix`
+    (case insensitive).
+
+    Like `Path(root).glob(f"**/*{suffix}")`, but using the `os.scandir` entries
+    directly. Symlinked folders are not followed and unreadable folders skipped.
+
+    Args:
+        root: The folder to search in.
+        suffix: The file name suffix, e.g. `".sav"`.
+        first_per_folder (optional): Yield only the first matching file per folder.
+    """
+    suffix = suffix.casefold()
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                found = False
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif not found and entry.name.casefold().endswith(suffix):
+                        found = first_per_folder
+                        yield entry.path
+        except OSError:
+            continue
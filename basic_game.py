@@ -13,6 +13,7 @@ from .basic_features.basic_save_game_info import (
     BasicGameSaveGame,
     BasicGameSaveGameInfo,
 )
+from .basic_features.utils import scan_files_with_suffix
 
 
 def replace_variables(value: str, game: BasicGame) -> str:
@@ -571,8 +572,8 @@ class BasicGame(mobase.IPluginGame):
     def listSaves(self, folder: QDir) -> list[mobase.ISaveGame]:
         ext = self._mappings.savegameExtension.get()
         return [
-            BasicGameSaveGame(path)
-            for path in Path(folder.absolutePath()).glob(f"**/*.{ext}")
+            BasicGameSaveGame(Path(path))
+            for path in scan_files_with_suffix(folder.absolutePath(), f".{ext}")
         ]
 
     def initializeProfile(
@@ -1,5 +1,7 @@
 import filecmp
+import fnmatch
 import json
+import os
 import re
 import shutil
 from collections import Counter
@@ -17,7 +19,7 @@ from ..basic_features.basic_save_game_info import (
     BasicGameSaveGameInfo,
     format_date,
 )
-from ..basic_features.utils import is_directory
+from ..basic_features.utils import is_directory, scan_files_with_suffix
 from ..basic_game import BasicGame
 
 
@@ -53,6 +55,7 @@ class CyberpunkModDataChecker(BasicModDataChecker):
         "bin/x64/plugins/cyber_engine_tweaks.asi": "root/bin/x64/plugins/",
     }
     _cet_path = "bin/x64/plugins/cyber_engine_tweaks/"
+    _root_cet_path = f"root/{_cet_path}"
 
     def dataLooksValid(
         self, filetree: mobase.IFileTree
@@ -93,10 +96,10 @@ class CyberpunkModDataChecker(BasicModDataChecker):
         if filetree := super().fix(filetree):
             filetree = self._fix_cet_framework(filetree)
             # REDmod
+            # `valid.match` is case insensitive already, no need to casefold.
+            valid_match = self._regex_patterns.valid.match
             for entry in list(filetree):
-                if not self._regex_patterns.valid.match(
-                    entry.name().casefold()
-                ) and self._valid_redmod(entry):
+                if not valid_match(entry.name()) and self._valid_redmod(entry):
                     filetree.move(entry, "mods/")
         return filetree
 
@@ -110,15 +113,14 @@ class CyberpunkModDataChecker(BasicModDataChecker):
             self._cet_path, mobase.FileTreeEntry.FileTypes.DIRECTORY
         ):
             assert is_directory(cet_folder)
-            root_cet_path = f"root/{self._cet_path}"
             if not cet_folder.exists("mods"):
                 parent = cet_folder.parent()
-                filetree.move(cet_folder, root_cet_path.rstrip("/\\"))
+                filetree.move(cet_folder, self._root_cet_path.rstrip("/\\"))
             else:
                 parent = cet_folder
                 for entry in list(cet_folder):
                     if entry.name() != "mods":
-                        filetree.move(entry, root_cet_path)
+                        filetree.move(entry, self._root_cet_path)
             clear_empty_folder(parent)
         return filetree
 
@@ -169,13 +171,16 @@ class CyberpunkSaveGame(BasicGameSaveGame):
 
     def __init__(self, filepath: Path):
         super().__init__(filepath)
-        try:  # Custom name from Named Saves
-            with open(filepath / self._name_file) as file:
-                self._name = file.readline()
-        except FileNotFoundError:
-            self._name = ""
+        self._name: str | None = None
+        """Custom name, read on first `getName` call."""
 
     def getName(self) -> str:
+        if self._name is None:
+            try:  # Custom name from Named Saves
+                with open(self._filepath / self._name_file) as file:
+                    self._name = file.readline()
+            except FileNotFoundError:
+                self._name = ""
         return self._name or super().getName()
 
     def getCreationTime(self) -> QDateTime:
@@ -188,6 +193,8 @@ class CyberpunkSaveGame(BasicGameSaveGame):
 class ModListFile:
     list_path: Path
     mod_search_pattern: str
+    """Glob relative to a mod, with wildcards only in the last part.
+    A trailing `/` matches folders only."""
     reversed_priority: bool = False
     """True: load order priority is reversed compared to MO (first mod has priority)."""
 
@@ -256,16 +263,28 @@ class ModListFileManager(dict[_MOD_TYPE, ModListFile]):
         (reversed with `self[mod_type].reversed_priority = True`).
         """
         mod_search_pattern = self[mod_type].mod_search_pattern
+        # Scan the literal parent folder directly, instead of `Path.glob` per mod.
+        folder, _, name_glob = mod_search_pattern.rstrip("/").rpartition("/")
+        dirs_only = mod_search_pattern.endswith("/")
+        match_name = re.compile(fnmatch.translate(name_glob), re.I).match
         for mod_path in self.active_mod_paths(self[mod_type].reversed_priority):
-            yield from mod_path.glob(mod_search_pattern)
+            try:
+                with os.scandir(mod_path / folder) as entries:
+                    for entry in entries:
+                        if match_name(entry.name) and (not dirs_only or entry.is_dir()):
+                            yield Path(entry.path)
+            except OSError:
+                continue
 
     def active_mod_paths(self, reverse: bool = False) -> Iterable[Path]:
         """Yield the path to active mods in MOs load order."""
         mods_path = Path(self._organizer.modsPath())
         modlist = self._organizer.modList()
         mods_load_order = modlist.allModsByProfilePriority()
+        state = modlist.state
+        active = mobase.ModState.ACTIVE
         for mod in reversed(mods_load_order) if reverse else mods_load_order:
-            if modlist.state(mod) & mobase.ModState.ACTIVE:
+            if state(mod) & active:
                 yield mods_path / mod
 
 
@@ -281,8 +300,13 @@ class PluginDefaultSettings:
     def apply(self) -> bool:
         if not self.is_plugin_enabled():
             return False
+        get_setting = self.organizer.pluginSetting
+        set_setting = self.organizer.setPluginSetting
+        plugin_name = self.plugin_name
         for setting, value in self.settings.items():
-            self.organizer.setPluginSetting(self.plugin_name, setting, value)
+            # Only write changed settings, each write is persisted.
+            if get_setting(plugin_name, setting) != value:
+                set_setting(plugin_name, setting, value)
         return True
 
 
@@ -305,6 +329,7 @@ class Cyberpunk2077Game(BasicGame):
         r"https://github.com/ModOrganizer2/modorganizer-basic_games/wiki/"
         "Game:-Cyberpunk-2077"
     )
+    GameIniFiles = ["UserSettings.json"]
 
     _redmod_binary = Path("tools/redmod/bin/redMod.exe")
     _redmod_log = Path("tools/redmod/bin/REDmodLog.txt")
@@ -312,6 +337,9 @@ class Cyberpunk2077Game(BasicGame):
     _redmod_deploy_args = "deploy -reportProgress"
     """Deploy arguments for `redmod.exe`, -modlist=... is added."""
 
+    _executables_cache: tuple[str, list[mobase.ExecutableInfo]] | None = None
+    """`(game_path, executables)`, reset on `skipStartScreen` setting change."""
+
     def init(self, organizer: mobase.IOrganizer) -> bool:
         super().init(organizer)
         self._register_feature(BasicLocalSavegames(self.savesDirectory()))
@@ -382,15 +410,16 @@ class Cyberpunk2077Game(BasicGame):
                 self._modlist_files["archive"].reversed_priority = bool(new)
             elif setting == "reverse_remod_load_order":
                 self._modlist_files["redmod"].reversed_priority = bool(new)
-
-    def iniFiles(self):
-        return ["UserSettings.json"]
+            elif setting == "skipStartScreen":
+                self._executables_cache = None
 
     def listSaves(self, folder: QDir) -> list[mobase.ISaveGame]:
         ext = self._mappings.savegameExtension.get()
         return [
-            CyberpunkSaveGame(path.parent)
-            for path in Path(folder.absolutePath()).glob(f"**/*.{ext}")
+            CyberpunkSaveGame(Path(path).parent)
+            for path in scan_files_with_suffix(
+                folder.absolutePath(), f".{ext}", first_per_folder=True
+            )
         ]
 
     def settings(self) -> list[mobase.PluginSetting]:
@@ -460,8 +489,16 @@ class Cyberpunk2077Game(BasicGame):
         self._organizer.setPluginSetting(self.name(), key, value)
 
     def executables(self) -> list[mobase.ExecutableInfo]:
-        game_name = self.gameName()
         game_dir = self.gameDirectory()
+        game_path = game_dir.absolutePath()
+        if self._executables_cache is None or self._executables_cache[0] != game_path:
+            self._executables_cache = (game_path, self._build_executables(game_dir))
+        return list(self._executables_cache[1])
+
+    def _build_executables(self, game_dir: QDir) -> list[mobase.ExecutableInfo]:
+        """Builds the list returned (and cached) by `executables`."""
+        game_name = self.gameName()
+        game_path = Path(game_dir.absolutePath())
         bin_path = game_dir.absoluteFilePath(self.binaryName())
         skip_start_screen = (
             " -skipStartScreen" if self._get_setting("skipStartScreen") else ""
@@ -480,7 +517,7 @@ class Cyberpunk2077Game(BasicGame):
             # Deploy REDmods only
             mobase.ExecutableInfo(
                 "Manually deploy REDmod",
-                self._get_redmod_binary(),
+                self._get_redmod_binary(game_path),
             ).withArgument("deploy -reportProgress -force %modlist%"),
             # Launcher
             mobase.ExecutableInfo(
@@ -489,15 +526,22 @@ class Cyberpunk2077Game(BasicGame):
             ).withArgument(f"{skip_start_screen}"),
         ]
 
-    def _get_redmod_binary(self) -> Path:
-        """Absolute path to redmod binary"""
-        return Path(self.gameDirectory().absolutePath(), self._redmod_binary)
+    def _get_redmod_binary(self, game_path: Path | None = None) -> Path:
+        """Absolute path to redmod binary
+
+        Args:
+            game_path (optional): Already resolved `self.gameDirectory()`.
+        """
+        if game_path is None:
+            game_path = Path(self.gameDirectory().absolutePath())
+        return game_path / self._redmod_binary
 
     def _onAboutToRun(self, app_path_str: str, wd: QDir, args: str) -> bool:
         if not self.isActive():
             return True
         app_path = Path(app_path_str)
-        if app_path == self._get_redmod_binary():
+        game_path = Path(self.gameDirectory().absolutePath())
+        if app_path == self._get_redmod_binary(game_path):
             if m := re.search(r"%modlist%", args, re.I):
                 # Manual deployment: replace %modlist% variable
                 (
@@ -518,7 +562,7 @@ class Cyberpunk2077Game(BasicGame):
             return True  # No recursive redmod call
         if (
             self._get_setting("auto_deploy_redmod")
-            and app_path == Path(self.gameDirectory().absolutePath(), self.binaryName())
+            and app_path == game_path / self.binaryName()
             and "-modded" in args
             and not self._check_redmod_result(self._deploy_redmod())
         ):
@@ -638,8 +682,10 @@ class Cyberpunk2077Game(BasicGame):
 
     def _unmapped_cache_files(self, data_path: Path) -> Iterable[Path]:
         """Yields unmapped cache files relative to `data_path`."""
+        # String prefix test instead of `Path.relative_to` + `ValueError` per file.
+        prefix = os.path.normcase(os.path.join(os.path.abspath(data_path), ""))
+        prefix_len = len(prefix)
         for file in self._organizer.findFiles("r6/cache", "*"):
-            try:
-                yield Path(file).absolute().relative_to(data_path)
-            except ValueError:
-                continue
+            file = os.path.abspath(file)
+            if os.path.normcase(file).startswith(prefix):
+                yield Path(file[prefix_len:])
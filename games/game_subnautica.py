@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import fnmatch
 import os
+import re
 from collections.abc import Iterable
 from enum import Enum
 from pathlib import Path
@@ -21,6 +22,9 @@ from ..basic_game import BasicGame
 class SubnauticaModDataChecker(BasicModDataChecker):
     use_qmods: bool = False
 
+    _dll_pattern = re.compile(fnmatch.translate("*.dll"), re.I)
+    """Compiled once, instead of `fnmatch.fnmatch` per entry."""
+
     def __init__(self, patterns: GlobPatterns | None = None, use_qmods: bool = False):
         super().__init__(
             GlobPatterns(
@@ -64,9 +68,7 @@ class SubnauticaModDataChecker(BasicModDataChecker):
         # A single unknown folder with a dll file in is to be moved to BepInEx/plugins/
         if (
             check_return is self.INVALID
-            and len(filetree) == 1
-            and is_directory(folder := filetree[0])
-            and any(fnmatch.fnmatch(entry.name(), "*.dll") for entry in folder)
+            and self._get_dll_mod_folder(filetree) is not None
         ):
             return self.FIXABLE
         return check_return
@@ -75,13 +77,23 @@ class SubnauticaModDataChecker(BasicModDataChecker):
         filetree = super().fix(filetree)
         if (
             self.dataLooksValid(filetree) is self.FIXABLE
-            and len(filetree) == 1
-            and is_directory(folder := filetree[0])
-            and any(fnmatch.fnmatch(entry.name(), "*.dll") for entry in folder)
+            and (folder := self._get_dll_mod_folder(filetree)) is not None
         ):
             filetree.move(folder, "QMods/" if self.use_qmods else "BepInEx/plugins/")
         return filetree
 
+    def _get_dll_mod_folder(
+        self, filetree: mobase.IFileTree
+    ) -> mobase.IFileTree | None:
+        """Returns the single (unknown) root folder of `filetree`, if it contains a
+        dll file.
+        """
+        if len(filetree) == 1 and is_directory(folder := filetree[0]):
+            match = self._dll_pattern.match
+            if any(match(entry.name()) for entry in folder):
+                return folder
+        return None
+
 
 class SubnauticaGame(BasicGame, mobase.IPluginFileMapper):
     Name = "Subnautica Support Plugin"
@@ -107,9 +119,13 @@ class SubnauticaGame(BasicGame, mobase.IPluginFileMapper):
         r"\Subnautica\Subnautica\SavedGames"
     ]
 
-    _forced_libraries = ["winhttp.dll"]
+    _forced_libraries = ("winhttp.dll",)
+
+    _forced_loads: list[mobase.ExecutableForcedLoadSetting] | None = None
+    """Built once by `executableForcedLoads`."""
 
-    _root_blacklist = {GameDataPath.casefold()}
+    _root_blacklist = frozenset({GameDataPath.casefold()})
+    """Casefolded root entry names that are never mapped."""
 
     class MapType(Enum):
         FILE = 0
@@ -127,9 +143,14 @@ class SubnauticaGame(BasicGame, mobase.IPluginFileMapper):
     def __init__(self):
         super().__init__()
         mobase.IPluginFileMapper.__init__(self)
+        self._skipped_root_entries: set[tuple[str, str]] = set()
+        """`(mod_name, entry_name)` of blacklisted root entries, warned about once."""
 
     def init(self, organizer: mobase.IOrganizer) -> bool:
         super().init(organizer)
+        self._extra_save_paths = tuple(
+            os.path.expandvars(p) for p in self._game_extra_save_paths
+        )
         self._set_mod_data_checker()
         self._register_feature(
             BasicGameSaveGameInfo(lambda s: Path(s or "", "screenshot.jpg"))
@@ -175,14 +196,18 @@ class SubnauticaGame(BasicGame, mobase.IPluginFileMapper):
         ]
 
     def listSaves(self, folder: QDir) -> list[mobase.ISaveGame]:
-        return [
-            BasicGameSaveGame(folder)
-            for save_path in (
-                folder.absolutePath(),
-                *(os.path.expandvars(p) for p in self._game_extra_save_paths),
-            )
-            for folder in Path(save_path).glob("slot*")
-        ]
+        saves: list[mobase.ISaveGame] = []
+        for save_path in (folder.absolutePath(), *self._extra_save_paths):
+            try:
+                with os.scandir(save_path) as entries:
+                    saves.extend(
+                        BasicGameSaveGame(Path(entry.path))
+                        for entry in entries
+                        if entry.name.casefold().startswith("slot")
+                    )
+            except OSError:
+                continue
+        return saves
 
     def executables(self) -> list[mobase.ExecutableInfo]:
         binary = self.gameDirectory().absoluteFilePath(self.binaryName())
@@ -198,79 +223,150 @@ class SubnauticaGame(BasicGame, mobase.IPluginFileMapper):
         ]
 
     def executableForcedLoads(self) -> list[mobase.ExecutableForcedLoadSetting]:
-        return [
-            mobase.ExecutableForcedLoadSetting(self.binaryName(), lib).withEnabled(True)
-            for lib in self._forced_libraries
-        ]
+        if self._forced_loads is None:
+            binary = self.binaryName()
+            self._forced_loads = [
+                mobase.ExecutableForcedLoadSetting(binary, lib).withEnabled(True)
+                for lib in self._forced_libraries
+            ]
+        return list(self._forced_loads)
 
     def mappings(self) -> list[mobase.Mapping]:
         game = self._organizer.managedGame()
-        game_path = Path(game.gameDirectory().absolutePath())
-        overwrite_path = Path(self._organizer.overwritePath())
+        # Plain (normalized) strings, the mappings are built per root entry.
+        game_path = os.path.normpath(game.gameDirectory().absolutePath())
+        overwrite_path = os.path.normpath(self._organizer.overwritePath())
+        # One directory listing instead of an `exists()` call per mapped entry.
+        try:
+            game_entries = {name.casefold() for name in os.listdir(game_path)}
+        except OSError:
+            game_entries = set()
 
-        return [
-            *(
-                # Extra overwrites
+        mappings: list[mobase.Mapping] = []
+        overwrite_dirs: set[str] = set()
+        # Extra overwrites
+        for name, map_type in self._root_extra_overwrites.items():
+            if name.casefold() in game_entries:
+                continue
+            is_dir = map_type is self.MapType.FOLDER
+            if is_dir:
+                overwrite_dirs.add(name)
+            mappings.append(
                 self._overwrite_mapping(
-                    overwrite_path / name,
-                    dest,
-                    is_dir=(map_type is self.MapType.FOLDER),
+                    os.path.join(overwrite_path, name),
+                    os.path.join(game_path, name),
+                    is_dir=is_dir,
                 )
-                for name, map_type in self._root_extra_overwrites.items()
-                if not (dest := game_path / name).exists()
-            ),
-            *self._root_mappings(game_path, overwrite_path),
-        ]
-
-    def _root_mappings(
-        self, game_path: Path, overwrite_path: Path
-    ) -> Iterable[mobase.Mapping]:
-        for mod_path in self._active_mod_paths():
-            mod_name = mod_path.name
-
-            for child in mod_path.iterdir():
-                # Check blacklist
-                if child.name.casefold() in self._root_blacklist:
-                    qWarning(f"Skipping {child.name} ({mod_name})")
-                    continue
-                destination = game_path / child.name
-                # Check existing
-                if destination.exists():
-                    qWarning(
-                        f"Overwriting of existing game files/folders is not supported! "
-                        f"{destination.as_posix()} ({mod_name})"
+            )
+        if mod_paths := self._active_mod_paths():
+            root_mappings, root_dirs = self._root_mappings(
+                mod_paths, game_path, game_entries
+            )
+            mappings.extend(root_mappings)
+            # Mapping: overwrite <-> root
+            # Once per folder, after all mod mappings to keep the highest priority.
+            for name in root_dirs.values():
+                overwrite_dirs.add(name)
+                mappings.append(
+                    self._overwrite_mapping(
+                        os.path.join(overwrite_path, name),
+                        os.path.join(game_path, name),
+                        is_dir=True,
                     )
-                    continue
-                # Mapping: mod -> root
-                yield mobase.Mapping(
-                    source=str(child),
-                    destination=str(destination),
-                    is_directory=child.is_dir(),
-                    create_target=False,
                 )
-                if child.is_dir():
-                    # Mapping: overwrite <-> root
-                    yield self._overwrite_mapping(
-                        overwrite_path / child.name, destination, is_dir=True
+        if overwrite_dirs:
+            self._ensure_overwrite_dirs(overwrite_path, overwrite_dirs)
+        return mappings
+
+    def _root_mappings(
+        self, mod_paths: Iterable[str], game_path: str, game_entries: set[str]
+    ) -> tuple[list[mobase.Mapping], dict[str, str]]:
+        """Mappings: mod -> root, for the (active) `mod_paths`.
+
+        Args:
+            game_entries: Casefolded names of the entries in `game_path`.
+
+        Returns:
+            `(mappings, root_dirs)`, with the mapped root folders as
+            `{casefolded_name: name}`.
+        """
+        mappings: list[mobase.Mapping] = []
+        root_dirs: dict[str, str] = {}
+        append = mappings.append
+        for mod_path in mod_paths:
+            mod_name = os.path.basename(mod_path)
+
+            with os.scandir(mod_path) as entries:
+                for entry in entries:
+                    name = entry.name
+                    folded_name = name.casefold()
+                    # Check blacklist
+                    if folded_name in self._root_blacklist:
+                        # Warn only once per session, `mappings` is called often.
+                        if (mod_name, name) not in self._skipped_root_entries:
+                            self._skipped_root_entries.add((mod_name, name))
+                            qWarning(f"Skipping {name} ({mod_name})")
+                        continue
+                    destination = os.path.join(game_path, name)
+                    # Check existing
+                    if folded_name in game_entries:
+                        qWarning(
+                            "Overwriting of existing game files/folders is not"
+                            f" supported! {Path(destination).as_posix()} ({mod_name})"
+                        )
+                        continue
+                    is_dir = entry.is_dir()
+                    # Mapping: mod -> root
+                    append(
+                        mobase.Mapping(
+                            source=entry.path,
+                            destination=destination,
+                            is_directory=is_dir,
+                            create_target=False,
+                        )
                     )
+                    if is_dir:
+                        root_dirs.setdefault(folded_name, name)
+        return mappings, root_dirs
 
-    def _active_mod_paths(self) -> Iterable[Path]:
-        mods_parent_path = Path(self._organizer.modsPath())
-        modlist = self._organizer.modList().allModsByProfilePriority()
-        for mod in modlist:
-            if self._organizer.modList().state(mod) & mobase.ModState.ACTIVE:
-                yield mods_parent_path / mod
+    def _active_mod_paths(self) -> list[str]:
+        mods_parent_path = os.path.normpath(self._organizer.modsPath())
+        modlist = self._organizer.modList()
+        state = modlist.state
+        active = mobase.ModState.ACTIVE
+        return [
+            os.path.join(mods_parent_path, mod)
+            for mod in modlist.allModsByProfilePriority()
+            if state(mod) & active
+        ]
 
     def _overwrite_mapping(
-        self, overwrite_source: Path, destination: Path, is_dir: bool
+        self, overwrite_source: str, destination: str, is_dir: bool
     ) -> mobase.Mapping:
-        """Mapping: overwrite <-> root"""
-        if is_dir:
-            # Root folders in overwrite need to exits.
-            overwrite_source.mkdir(parents=True, exist_ok=True)
+        """Mapping: overwrite <-> root
+
+        Folders need to be created with `_ensure_overwrite_dirs`.
+        """
         return mobase.Mapping(
-            str(overwrite_source),
-            str(destination),
+            overwrite_source,
+            destination,
             is_dir,
             create_target=True,
         )
+
+    def _ensure_overwrite_dirs(self, overwrite_path: str, names: Iterable[str]):
+        """Creates the root folders (`names`) in overwrite, which need to exist.
+        Existing folders are skipped, based on a single listing of `overwrite_path`.
+        """
+        try:
+            with os.scandir(overwrite_path) as entries:
+                existing = {
+                    entry.name.casefold()
+                    for entry in entries
+                    if entry.is_dir(follow_symlinks=False)
+                }
+        except FileNotFoundError:
+            existing = set()
+        for name in names:
+            if name.casefold() not in existing:
+                os.makedirs(os.path.join(overwrite_path, name), exist_ok=True)
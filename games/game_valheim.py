@@ -91,6 +91,7 @@ class DebugTable:
             {c: c for c in self._column_keys},
             {c: "-" * len(c) for c in self._column_keys},
         ]
+        self._has_data = False
 
     def add(
         self,
@@ -107,14 +108,17 @@ class DebugTable:
                 # Append line if element in last list is set.
                 self._table.append(dict.fromkeys(self._column_keys, ""))
             self._table[-1][k] = str(v)
+            self._has_data = True
 
     def print(self, output_file: Optional[TextIO] = None):
-        if self._table:
+        """Print the table, if data has been added to it."""
+        if self._table and self._has_data:
             for line in self._table:
                 print("|", " | ".join(line.values()), "|", file=output_file)
             if output_file:
                 output_file.flush()
             self._table = []
+            self._has_data = False
 
 
 class OverwriteSync:
@@ -154,7 +158,8 @@ class OverwriteSync:
                     target_path = mod_path / file_path.relative_to(overwrite_path)
                     self._debug(mod=mod, target_path=target_path)
                     move_file(file_path, target_path)
-                self._debug.print()
+        # Print the debug table once, not per file.
+        self._debug.print()
 
     def _get_active_mods(
         self, modlist: mobase.IModList | None = None
@@ -302,7 +307,10 @@ class ValheimGame(BasicGame):
         r"https://github.com/ModOrganizer2/modorganizer-basic_games/wiki/Game:-Valheim"
     )
 
-    _forced_libraries = ["winhttp.dll"]
+    _forced_libraries = ("winhttp.dll",)
+
+    _forced_loads: list[mobase.ExecutableForcedLoadSetting] | None = None
+    """Built once by `executableForcedLoads`."""
 
     def init(self, organizer: mobase.IOrganizer) -> bool:
         super().init(organizer)
@@ -369,10 +377,13 @@ class ValheimGame(BasicGame):
         return True
 
     def executableForcedLoads(self) -> list[mobase.ExecutableForcedLoadSetting]:
-        return [
-            mobase.ExecutableForcedLoadSetting(self.binaryName(), lib).withEnabled(True)
-            for lib in self._forced_libraries
-        ]
+        if self._forced_loads is None:
+            binary = self.binaryName()
+            self._forced_loads = [
+                mobase.ExecutableForcedLoadSetting(binary, lib).withEnabled(True)
+                for lib in self._forced_libraries
+            ]
+        return list(self._forced_loads)
 
     def listSaves(self, folder: QDir) -> list[mobase.ISaveGame]:
         save_games = super().listSaves(folder)